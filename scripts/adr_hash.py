@@ -1,54 +1,99 @@
 #!/usr/bin/env python3
 import argparse
 import hashlib
+import mmap
+import os
 import re
 from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
 
+T = TypeVar("T")
 
-ADR_LINE_RE = re.compile(r"^(ADR_BODY_SHA256:)\s*([0-9a-fA-F]{64})\s*$")
 
+# Matched (MULTILINE-anchored) at each line start where ADR_MARKER occurs; `[ \t]` rather than `\s`
+# so a match can't run across lines. Bytes patterns only ever use ASCII semantics, and the marker
+# is a plain literal: the hash is the only capture.
+ADR_LINE_RE = re.compile(rb"^ADR_BODY_SHA256:[ \t]*([0-9a-fA-F]{64})[ \t]*$", re.MULTILINE)
+ADR_MARKER = b"ADR_BODY_SHA256:"
+# The hashed form of the ADR line is always rewritten as `ADR_BODY_SHA256: <64 zeroes>`.
+ADR_PREFIX = ADR_MARKER + b" "
+ZERO_HASH = b"0" * 64
+_CR_TO_LF = bytes.maketrans(b"\r", b"\n")
 
-def normalized_for_hash(text: str) -> str:
-    # Normalize line endings and replace the hash value with 64 zeroes so the hash is stable.
-    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
-    out = []
-    replaced = 0
-    for line in lines:
-        m = ADR_LINE_RE.match(line)
-        if m:
-            out.append(f"{m.group(1)} " + ("0" * 64))
-            replaced += 1
-        else:
-            out.append(line)
-    if replaced != 1:
-        raise SystemExit(
-            f"expected exactly one ADR_BODY_SHA256 line, found {replaced}; refusing to hash"
-        )
-    return "\n".join(out)
+
+def _iter_adr_lines(buf) -> Iterator[re.Match[bytes]]:
+    # find() is a plain substring search, much cheaper than running the regex over every line.
+    # ADRs also mention the marker in prose, so each hit is confirmed with an anchored match.
+    pos = buf.find(ADR_MARKER)
+    while pos != -1:
+        if pos == 0 or buf[pos - 1] == 0x0A:  # b"\n"
+            m = ADR_LINE_RE.match(buf, pos)
+            if m is not None:
+                yield m
+        pos = buf.find(ADR_MARKER, pos + len(ADR_MARKER))
+
+
+def _locate_adr(buf) -> tuple[int, int]:
+    """Return the (start, end) span of the single ADR_BODY_SHA256 line in `buf`."""
+    lines = _iter_adr_lines(buf)
+    m = next(lines, None)
+    if m is None or next(lines, None) is not None:
+        found = sum(1 for _ in _iter_adr_lines(buf))
+        raise SystemExit(f"expected exactly one ADR_BODY_SHA256 line, found {found}; refusing to hash")
+    return m.start(), m.end()
+
+
+def _normalize_newlines(data: bytes) -> bytes:
+    # Most ADRs are LF-only: one memchr-speed scan and no copies.
+    if b"\r" not in data:
+        return data
+    # CRLF -> LF, then any lone CR -> LF via a single translate pass (which never resizes).
+    return data.replace(b"\r\n", b"\n").translate(_CR_TO_LF)
+
+
+def _hash_with_zeroed_line(buf, start: int, end: int) -> str:
+    # Hash `buf` with the ADR line zeroed so the hash is stable. Callers normalize line endings.
+    h = hashlib.sha256()
+    with memoryview(buf) as view:
+        h.update(view[:start])
+        h.update(ADR_PREFIX + ZERO_HASH)
+        h.update(view[end:])
+    return h.hexdigest()
+
+
+def _with_adr_buffer(path: Path, fn: Callable[[Any], T]) -> T:
+    """Read `path` once and call `fn` on its newline-normalized contents."""
+    with path.open("rb") as f:
+        # mmap refuses empty files; those fall through and fail in _locate_adr.
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"\r") == -1:
+                    # LF-only: work straight out of the mapping.
+                    return fn(mm)
+        data = _normalize_newlines(f.read())
+    return fn(data)
+
+
+def _expected_hash(buf) -> str:
+    return _hash_with_zeroed_line(buf, *_locate_adr(buf))
+
+
+def _stored_and_expected_hash(buf) -> tuple[str, str]:
+    start, end = _locate_adr(buf)
+    stored = ADR_LINE_RE.match(buf, start).group(1).decode("ascii").lower()
+    return stored, _hash_with_zeroed_line(buf, start, end)
 
 
 def compute_hash(path: Path) -> str:
-    text = path.read_text(encoding="utf-8")
-    normalized = normalized_for_hash(text).encode("utf-8")
-    return hashlib.sha256(normalized).hexdigest()
+    return _with_adr_buffer(path, _expected_hash)
 
 
 def fix_file(path: Path) -> str:
-    text = path.read_text(encoding="utf-8").replace("\r\n", "\n").replace("\r", "\n")
-    new_hash = compute_hash(path)
-
-    lines = text.split("\n")
-    replaced = 0
-    for i, line in enumerate(lines):
-        m = ADR_LINE_RE.match(line)
-        if m:
-            lines[i] = f"{m.group(1)} {new_hash}"
-            replaced += 1
-    if replaced != 1:
-        raise SystemExit(
-            f"expected exactly one ADR_BODY_SHA256 line, found {replaced}; refusing to fix"
-        )
-    path.write_text("\n".join(lines), encoding="utf-8")
+    # One read: normalize, hash, and splice the new value into the same buffer.
+    data = _normalize_newlines(path.read_bytes())
+    start, end = _locate_adr(data)
+    new_hash = _hash_with_zeroed_line(data, start, end)
+    path.write_bytes(data[:start] + ADR_PREFIX + new_hash.encode("ascii") + data[end:])
     return new_hash
 
 
@@ -66,17 +111,8 @@ def main() -> int:
         print(h)
         return 0
 
-    expected = compute_hash(args.adr)
-    text = args.adr.read_text(encoding="utf-8").replace("\r\n", "\n").replace("\r", "\n")
-    actual = None
-    for line in text.split("\n"):
-        m = ADR_LINE_RE.match(line)
-        if m:
-            actual = m.group(2).lower()
-            break
-
-    if actual is None:
-        raise SystemExit("missing ADR_BODY_SHA256 line")
+    # One read yields both the stored value and the expected one.
+    actual, expected = _with_adr_buffer(args.adr, _stored_and_expected_hash)
 
     if actual != expected:
         print(f"ADR hash mismatch:\n  file:     {actual}\n  expected: {expected}")
@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import functools
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    # Optional accelerator; parses bytes directly. Its JSONDecodeError subclasses json's.
+    import orjson
 
-_JSON_FENCE_RE = re.compile(r"```json\n(.*?)\n```", re.DOTALL)
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Matched against raw file bytes (no decode of the surrounding prose); `\r?` keeps CRLF plans
+# working now that read_text's newline translation no longer applies.
+_JSON_FENCE_RE = re.compile(rb"```json\r?\n(.*?)\r?\n```", re.DOTALL)
 
 
 @dataclass(frozen=True)
@@ -20,18 +34,19 @@ class LintError:
         return f"{self.path}: {self.message}"
 
 
-def _extract_json_block(markdown: str, *, path: Path) -> dict:
+def _extract_json_block(markdown: bytes, *, path: Path) -> dict:
     match = _JSON_FENCE_RE.search(markdown)
     if not match:
         raise ValueError("missing ```json fenced block")
     try:
-        return json.loads(match.group(1))
+        return _loads(match.group(1))
     except json.JSONDecodeError as e:
         raise ValueError(f"invalid JSON in fenced block: {e}") from e
 
 
-def _load_tasks_json(tasks_path: Path) -> list[dict]:
-    raw = json.loads(tasks_path.read_text(encoding="utf-8"))
+def _load_tasks_json(tasks_path: Path) -> dict[str, dict]:
+    """Load tasks.json and index it by task id, validating shape and ids in a single pass."""
+    raw = _loads(tasks_path.read_bytes())
     if isinstance(raw, list):
         tasks = raw
     elif isinstance(raw, dict) and isinstance(raw.get("tasks"), list):
@@ -39,27 +54,53 @@ def _load_tasks_json(tasks_path: Path) -> list[dict]:
     else:
         raise ValueError("expected tasks.json to be a JSON array or an object with a top-level 'tasks' array")
 
-    normalized: list[dict] = []
+    by_id: dict[str, dict] = {}
     for i, t in enumerate(tasks):
         if not isinstance(t, dict):
             raise ValueError(f"task at index {i} is not an object")
-        normalized.append(t)
-    return normalized
+        tid = t.get("id")
+        if not isinstance(tid, str) or not tid:
+            raise ValueError("all tasks must have a non-empty string 'id'")
+        if tid in by_id:
+            raise ValueError(f"duplicate task id '{tid}' in tasks.json")
+        by_id[tid] = t
+    return by_id
+
+
+@functools.lru_cache(maxsize=128)
+def _load_tasks_json_cached(tasks_path: str, mtime_ns: int, size: int) -> dict[str, dict]:
+    # mtime_ns/size are only part of the cache key: an edited tasks.json misses the cache.
+    # Callers must treat the returned mapping as read-only since it is shared across hits.
+    return _load_tasks_json(Path(tasks_path))
 
 
-def _as_str_list(value: object, *, field: str) -> list[str]:
-    if not isinstance(value, list) or any(not isinstance(x, str) for x in value):
-        raise ValueError(f"field '{field}' must be an array of strings")
-    return list(value)
+# json.loads only ever produces exact list/dict/str instances, so these use `type(...) is`
+# checks and a plain loop that stops at the first bad element.
+def _is_list_of(value: object, typ: type) -> bool:
+    if type(value) is not list:
+        return False
+    for x in value:
+        if type(x) is not typ:
+            return False
+    return True
 
 
 def lint_ci_checkpoint_plan(plan_path: Path) -> list[LintError]:
+    """
+    Validate one plan and return every problem found, not just the first.
+
+    Problems are recorded and checking carries on; it only stops early when the structure needed
+    by later checks (fenced JSON, slices/checkpoints/wiring arrays, tasks.json) is unusable.
+    """
     errors: list[LintError] = []
     feature_dir = plan_path.parent
     feature_slug = feature_dir.name
 
+    def error(message: str) -> None:
+        errors.append(LintError(plan_path, message))
+
     try:
-        doc = plan_path.read_text(encoding="utf-8")
+        doc = plan_path.read_bytes()
         plan = _extract_json_block(doc, path=plan_path)
     except Exception as e:  # noqa: BLE001
         return [LintError(plan_path, str(e))]
@@ -68,180 +109,314 @@ def lint_ci_checkpoint_plan(plan_path: Path) -> list[LintError]:
         return [LintError(plan_path, "top-level JSON must be an object")]
 
     def require(field: str, typ: type) -> object:
+        # Returns None (after recording the problem) when the field is missing or mistyped.
         if field not in plan:
-            raise ValueError(f"missing required field '{field}'")
+            error(f"missing required field '{field}'")
+            return None
         v = plan[field]
         if not isinstance(v, typ):
-            raise ValueError(f"field '{field}' must be {typ.__name__}")
+            error(f"field '{field}' must be {typ.__name__}")
+            return None
         return v
 
-    try:
-        version = require("version", int)
-        if version != 1:
-            raise ValueError("field 'version' must be 1")
-
-        feature = require("feature", str)
-        if feature != feature_slug:
-            raise ValueError(f"field 'feature' must match feature dir name ('{feature_slug}')")
-
-        min_triads = require("min_triads_per_checkpoint", int)
-        max_triads = require("max_triads_per_checkpoint", int)
-        if min_triads <= 0 or max_triads <= 0 or min_triads > max_triads:
-            raise ValueError("min/max triads per checkpoint must be positive and min <= max")
-
-        slices = _as_str_list(require("slices", list), field="slices")
-        if not slices:
-            raise ValueError("'slices' must be non-empty")
-        if len(set(slices)) != len(slices):
-            raise ValueError("'slices' must not contain duplicates")
-
-        checkpoints = require("checkpoints", list)
-        if not isinstance(checkpoints, list) or any(not isinstance(cp, dict) for cp in checkpoints):
-            raise ValueError("'checkpoints' must be an array of objects")
-        if not checkpoints:
-            raise ValueError("'checkpoints' must be non-empty")
-
-        tasks_json_wiring = require("tasks_json_wiring", dict)
+    version = require("version", int)
+    if version is not None and version != 1:
+        error("field 'version' must be 1")
+
+    feature = require("feature", str)
+    if feature is not None and feature != feature_slug:
+        error(f"field 'feature' must match feature dir name ('{feature_slug}')")
+
+    min_triads = require("min_triads_per_checkpoint", int)
+    max_triads = require("max_triads_per_checkpoint", int)
+    bounds_ok = min_triads is not None and max_triads is not None
+    if bounds_ok and (min_triads <= 0 or max_triads <= 0 or min_triads > max_triads):
+        error("min/max triads per checkpoint must be positive and min <= max")
+        bounds_ok = False
+
+    slices = require("slices", list)
+    if slices is not None:
+        if not _is_list_of(slices, str):
+            error("field 'slices' must be an array of strings")
+            slices = None
+        elif not slices:
+            error("'slices' must be non-empty")
+            slices = None
+        elif len(frozenset(slices)) != len(slices):
+            error("'slices' must not contain duplicates")
+            slices = None
+
+    checkpoints = require("checkpoints", list)
+    if checkpoints is not None:
+        if not _is_list_of(checkpoints, dict):
+            error("'checkpoints' must be an array of objects")
+            checkpoints = None
+        elif not checkpoints:
+            error("'checkpoints' must be non-empty")
+            checkpoints = None
+
+    checkpoint_tasks_wiring = None
+    tasks_json_wiring = require("tasks_json_wiring", dict)
+    if tasks_json_wiring is not None:
         checkpoint_tasks_wiring = tasks_json_wiring.get("checkpoint_tasks")
-        if not isinstance(checkpoint_tasks_wiring, list) or any(not isinstance(x, dict) for x in checkpoint_tasks_wiring):
-            raise ValueError("tasks_json_wiring.checkpoint_tasks must be an array of objects")
-
-        # --- Slice partition validation ---
-        seen: set[str] = set()
-        slice_order = {s: i for i, s in enumerate(slices)}
-        last_max_index = -1
-        checkpoint_task_ids: set[str] = set()
-        for cp in checkpoints:
-            cp_id = cp.get("id")
-            if not isinstance(cp_id, str) or not cp_id:
-                raise ValueError("each checkpoint must have non-empty string field 'id'")
-
-            group = cp.get("slice_group")
-            if not isinstance(group, list) or any(not isinstance(s, str) for s in group) or not group:
-                raise ValueError(f"checkpoint '{cp_id}': slice_group must be a non-empty array of strings")
-
-            ending_slice = cp.get("ending_slice")
-            if not isinstance(ending_slice, str) or not ending_slice:
-                raise ValueError(f"checkpoint '{cp_id}': ending_slice must be a non-empty string")
-
-            if group[-1] != ending_slice:
-                raise ValueError(f"checkpoint '{cp_id}': ending_slice must equal last element of slice_group")
-
-            checkpoint_task_id = cp.get("checkpoint_task_id")
-            if not isinstance(checkpoint_task_id, str) or not checkpoint_task_id:
-                raise ValueError(f"checkpoint '{cp_id}': checkpoint_task_id must be a non-empty string")
+        if not _is_list_of(checkpoint_tasks_wiring, dict):
+            error("tasks_json_wiring.checkpoint_tasks must be an array of objects")
+            checkpoint_tasks_wiring = None
+
+    if slices is None or checkpoints is None or checkpoint_tasks_wiring is None:
+        return errors
+
+    # --- Slice partition validation ---
+    total_len = len(slices)
+    seen: set[str] = set()
+    slice_order = {s: i for i, s in enumerate(slices)}
+    last_max_index = -1
+    checkpoint_task_ids: set[str] = set()
+    # A skipped checkpoint leaves holes in `seen` / `checkpoint_task_ids`; the whole-plan
+    # comparisons below only run when nothing was skipped, so one bad entry doesn't cascade.
+    partition_complete = True
+    task_ids_complete = True
+    for cp in checkpoints:
+        cp_id = cp.get("id")
+        if not isinstance(cp_id, str) or not cp_id:
+            error("each checkpoint must have non-empty string field 'id'")
+            partition_complete = task_ids_complete = False
+            continue
+
+        group = cp.get("slice_group")
+        if not group or not _is_list_of(group, str):
+            error(f"checkpoint '{cp_id}': slice_group must be a non-empty array of strings")
+            partition_complete = False
+            group = None
+
+        ending_slice = cp.get("ending_slice")
+        if not isinstance(ending_slice, str) or not ending_slice:
+            error(f"checkpoint '{cp_id}': ending_slice must be a non-empty string")
+        elif group is not None and group[-1] != ending_slice:
+            error(f"checkpoint '{cp_id}': ending_slice must equal last element of slice_group")
+
+        checkpoint_task_id = cp.get("checkpoint_task_id")
+        if not isinstance(checkpoint_task_id, str) or not checkpoint_task_id:
+            error(f"checkpoint '{cp_id}': checkpoint_task_id must be a non-empty string")
+            task_ids_complete = False
+        else:
             checkpoint_task_ids.add(checkpoint_task_id)
 
-            for s in group:
-                if s not in slice_order:
-                    raise ValueError(f"checkpoint '{cp_id}': slice '{s}' is not listed in top-level slices")
-                if s in seen:
-                    raise ValueError(f"slice '{s}' appears in multiple checkpoint groups (overlap)")
-                seen.add(s)
-
-            # Ensure groups don't scramble slice order.
-            idxs = [slice_order[s] for s in group]
-            if idxs != sorted(idxs):
-                raise ValueError(f"checkpoint '{cp_id}': slice_group must preserve the order in 'slices'")
-            if max(idxs) < last_max_index:
-                raise ValueError(f"checkpoint '{cp_id}': checkpoint groups must be in slice order (no backward groups)")
-            last_max_index = max(idxs)
-
-            group_len = len(group)
-            total_len = len(slices)
-            if not (min_triads <= group_len <= max_triads):
-                if not (total_len < min_triads and group_len == total_len):
-                    raise ValueError(
-                        f"checkpoint '{cp_id}': slice_group length {group_len} outside bounds "
-                        f"[{min_triads}, {max_triads}] (no exception applies)"
-                    )
-
-        if seen != set(slices):
-            missing = [s for s in slices if s not in seen]
-            extra = [s for s in seen if s not in set(slices)]
-            if missing:
-                raise ValueError(f"checkpoint groups are missing slices: {missing}")
-            if extra:
-                raise ValueError(f"checkpoint groups contain unknown slices: {extra}")
-
-        # --- tasks.json wiring validation ---
-        tasks_path = feature_dir / "tasks.json"
-        if not tasks_path.exists():
-            raise ValueError("tasks.json not found next to ci_checkpoint_plan.md")
-        tasks = _load_tasks_json(tasks_path)
-        by_id: dict[str, dict] = {}
-        for t in tasks:
-            tid = t.get("id")
-            if not isinstance(tid, str) or not tid:
-                raise ValueError("all tasks must have a non-empty string 'id'")
-            if tid in by_id:
-                raise ValueError(f"duplicate task id '{tid}' in tasks.json")
-            by_id[tid] = t
-
-        wiring_ids: set[str] = set()
-        for w in checkpoint_tasks_wiring:
-            tid = w.get("id")
-            if not isinstance(tid, str) or not tid:
-                raise ValueError("tasks_json_wiring.checkpoint_tasks[].id must be a non-empty string")
-            wiring_ids.add(tid)
-
-            dep = w.get("depends_on_integration_task")
-            if not isinstance(dep, str) or not dep:
-                raise ValueError(f"checkpoint wiring '{tid}': depends_on_integration_task must be a non-empty string")
-
-            blocks = w.get("blocks_next_slice_start")
-            if blocks is not None and (not isinstance(blocks, str) or not blocks):
-                raise ValueError(f"checkpoint wiring '{tid}': blocks_next_slice_start must be null or a non-empty string")
-
-            if tid not in by_id:
-                raise ValueError(f"checkpoint wiring '{tid}': task id not found in tasks.json")
-            if dep not in by_id:
-                raise ValueError(f"checkpoint wiring '{tid}': depends_on integration task '{dep}' not found in tasks.json")
-
-            depends_on = by_id[tid].get("depends_on")
-            if not isinstance(depends_on, list) or any(not isinstance(x, str) for x in depends_on):
-                raise ValueError(f"checkpoint task '{tid}': depends_on must be an array of strings")
-            if dep not in depends_on:
-                raise ValueError(f"checkpoint task '{tid}': must depend_on '{dep}'")
-
-            if blocks is not None:
-                if blocks not in by_id:
-                    raise ValueError(f"checkpoint wiring '{tid}': blocks_next_slice_start task '{blocks}' not found in tasks.json")
-                blocks_depends = by_id[blocks].get("depends_on")
-                if not isinstance(blocks_depends, list) or any(not isinstance(x, str) for x in blocks_depends):
-                    raise ValueError(f"blocked task '{blocks}': depends_on must be an array of strings")
-                if tid not in blocks_depends:
-                    raise ValueError(f"blocked task '{blocks}': must depend_on checkpoint task '{tid}'")
-
-        if checkpoint_task_ids != wiring_ids:
-            missing = sorted(checkpoint_task_ids - wiring_ids)
-            extra = sorted(wiring_ids - checkpoint_task_ids)
-            if missing:
-                raise ValueError(f"tasks_json_wiring.checkpoint_tasks missing checkpoint_task_id(s): {missing}")
-            if extra:
-                raise ValueError(f"tasks_json_wiring.checkpoint_tasks has extra task id(s): {extra}")
-
-    except Exception as e:  # noqa: BLE001
-        errors.append(LintError(plan_path, str(e)))
+        if group is None:
+            continue
+
+        # One pass: membership, overlap, and "groups don't scramble slice order". Indexes must
+        # strictly increase within a group; prev_index tracks the group's max as we go.
+        prev_index = -1
+        order_ok = True
+        for s in group:
+            i = slice_order.get(s)
+            if i is None:
+                error(f"checkpoint '{cp_id}': slice '{s}' is not listed in top-level slices")
+                continue
+            if s in seen:
+                error(f"slice '{s}' appears in multiple checkpoint groups (overlap)")
+                continue
+            seen.add(s)
+            if i < prev_index and order_ok:
+                error(f"checkpoint '{cp_id}': slice_group must preserve the order in 'slices'")
+                order_ok = False
+            prev_index = max(prev_index, i)
+        if 0 <= prev_index < last_max_index:
+            error(f"checkpoint '{cp_id}': checkpoint groups must be in slice order (no backward groups)")
+        last_max_index = max(last_max_index, prev_index)
+
+        group_len = len(group)
+        if bounds_ok and not (min_triads <= group_len <= max_triads):
+            if not (total_len < min_triads and group_len == total_len):
+                error(
+                    f"checkpoint '{cp_id}': slice_group length {group_len} outside bounds "
+                    f"[{min_triads}, {max_triads}] (no exception applies)"
+                )
+
+    # Unknown slices are rejected before they reach `seen`, so it is always a subset of `slices`:
+    # equal sizes mean full coverage, and there can never be "extra" slices.
+    if partition_complete and len(seen) != total_len:
+        missing = [s for s in slices if s not in seen]
+        error(f"checkpoint groups are missing slices: {missing}")
+
+    # --- tasks.json wiring validation ---
+    tasks_path = feature_dir / "tasks.json"
+    try:
+        st = tasks_path.stat()
+    except FileNotFoundError:
+        error("tasks.json not found next to ci_checkpoint_plan.md")
+        return errors
+    try:
+        by_id = _load_tasks_json_cached(str(tasks_path), st.st_mtime_ns, st.st_size)
+    except (OSError, ValueError) as e:
+        error(str(e))
+        return errors
+
+    wiring_ids: set[str] = set()
+    wiring_complete = True
+    for w in checkpoint_tasks_wiring:
+        tid = w.get("id")
+        if not isinstance(tid, str) or not tid:
+            error("tasks_json_wiring.checkpoint_tasks[].id must be a non-empty string")
+            wiring_complete = False
+            continue
+        wiring_ids.add(tid)
+
+        dep = w.get("depends_on_integration_task")
+        if not isinstance(dep, str) or not dep:
+            error(f"checkpoint wiring '{tid}': depends_on_integration_task must be a non-empty string")
+            continue
+
+        blocks = w.get("blocks_next_slice_start")
+        if blocks is not None and (not isinstance(blocks, str) or not blocks):
+            error(f"checkpoint wiring '{tid}': blocks_next_slice_start must be null or a non-empty string")
+            continue
+
+        if tid not in by_id:
+            error(f"checkpoint wiring '{tid}': task id not found in tasks.json")
+            continue
+        if dep not in by_id:
+            error(f"checkpoint wiring '{tid}': depends_on integration task '{dep}' not found in tasks.json")
+            continue
+
+        depends_on = by_id[tid].get("depends_on")
+        if not _is_list_of(depends_on, str):
+            error(f"checkpoint task '{tid}': depends_on must be an array of strings")
+        elif dep not in depends_on:
+            error(f"checkpoint task '{tid}': must depend_on '{dep}'")
+
+        if blocks is not None:
+            if blocks not in by_id:
+                error(f"checkpoint wiring '{tid}': blocks_next_slice_start task '{blocks}' not found in tasks.json")
+                continue
+            blocks_depends = by_id[blocks].get("depends_on")
+            if not _is_list_of(blocks_depends, str):
+                error(f"blocked task '{blocks}': depends_on must be an array of strings")
+            elif tid not in blocks_depends:
+                error(f"blocked task '{blocks}': must depend_on checkpoint task '{tid}'")
+
+    if task_ids_complete and wiring_complete and checkpoint_task_ids != wiring_ids:
+        missing = sorted(checkpoint_task_ids - wiring_ids)
+        extra = sorted(wiring_ids - checkpoint_task_ids)
+        if missing:
+            error(f"tasks_json_wiring.checkpoint_tasks missing checkpoint_task_id(s): {missing}")
+        if extra:
+            error(f"tasks_json_wiring.checkpoint_tasks has extra task id(s): {extra}")
 
     return errors
 
 
+# Below this many plans, worker start-up costs more than linting serially.
+_PARALLEL_MIN_PLANS = 8
+
+
+def _lint_plans(plans: list[Path]) -> list[LintError]:
+    workers = min(8, os.cpu_count() or 1)
+    results: list[list[LintError]] | None = None
+    if workers > 1 and len(plans) >= _PARALLEL_MIN_PLANS:
+        # Plans are independent; executor.map keeps the output in plan order.
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lint_ci_checkpoint_plan, plans))
+        except (OSError, NotImplementedError):
+            # No usable multiprocessing primitives (e.g. restricted sandboxes); lint serially.
+            results = None
+    if results is None:
+        results = [lint_ci_checkpoint_plan(p) for p in plans]
+    return [err for errs in results for err in errs]
+
+
+def _input_mtimes(plan_path: Path) -> list[int] | None:
+    try:
+        return [plan_path.stat().st_mtime_ns, (plan_path.parent / "tasks.json").stat().st_mtime_ns]
+    except FileNotFoundError:
+        return None
+
+
+def _load_green_cache(cache_path: Path, linter_key: int) -> dict[str, list[int]]:
+    """Return {plan: [plan_mtime_ns, tasks_mtime_ns]} for plans that passed on the last run."""
+    try:
+        raw = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    # A changed linter invalidates every previous verdict.
+    if not isinstance(raw, dict) or raw.get("linter") != linter_key or not isinstance(raw.get("plans"), dict):
+        return {}
+    return raw["plans"]
+
+
+def _write_green_cache(cache_path: Path, linter_key: int, plans: dict[str, list[int]]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"linter": linter_key, "plans": plans}) + "\n", encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _plans_from_files(files: list[str], repo_root: Path, next_dir: Path) -> list[Path]:
+    """Map changed paths to the plans they affect (a plan, or a tasks.json next to one)."""
+    plans: set[Path] = set()
+    for f in files:
+        # Relative paths are repo-root-relative, as `git diff --name-only` prints them regardless
+        # of cwd; joining leaves absolute paths as they are.
+        p = (repo_root / f).resolve()
+        if p.name == "tasks.json":
+            p = p.with_name("ci_checkpoint_plan.md")
+        if p.name == "ci_checkpoint_plan.md" and p.parent.parent == next_dir and p.is_file():
+            plans.add(p)
+    return sorted(plans)
+
+
 def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Lint docs/project_management/next/*/ci_checkpoint_plan.md.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-lint every plan instead of skipping ones unchanged since they last passed",
+    )
+    parser.add_argument(
+        "--files",
+        # `*`, not `+`: an empty `git diff --name-only` means nothing to lint, not a usage error.
+        nargs="*",
+        metavar="PATH",
+        help="Only lint plans affected by these paths (e.g. from `git diff --name-only`)",
+    )
+    args = parser.parse_args(argv[1:])
+
     repo_root = Path(__file__).resolve().parent.parent
     next_dir = repo_root / "docs" / "project_management" / "next"
     if not next_dir.exists():
         print("lint-ci-checkpoint-plans: SKIP (docs/project_management/next/ missing)")
         return 0
 
-    plans = sorted(next_dir.glob("*/ci_checkpoint_plan.md"))
+    # With --files, skip the directory walk and only look at what changed.
+    if args.files is not None:
+        plans = _plans_from_files(args.files, repo_root, next_dir.resolve())
+    else:
+        plans = sorted(next_dir.glob("*/ci_checkpoint_plan.md"))
     if not plans:
         print("lint-ci-checkpoint-plans: OK (no ci_checkpoint_plan.md files found)")
         return 0
 
-    all_errors: list[LintError] = []
-    for plan_path in plans:
-        all_errors.extend(lint_ci_checkpoint_plan(plan_path))
+    # Skip plans whose inputs (plan + sibling tasks.json) are unchanged since they last passed.
+    # The cache lives under target/, which is never committed.
+    cache_path = repo_root / "target" / "lint_ci_checkpoint_plans.cache.json"
+    linter_key = Path(__file__).stat().st_mtime_ns
+    green = {} if args.no_cache else _load_green_cache(cache_path, linter_key)
+    inputs = {p: _input_mtimes(p) for p in plans}
+    rel = {p: p.relative_to(repo_root).as_posix() for p in plans}
+    stale = [p for p in plans if inputs[p] is None or green.get(rel[p]) != inputs[p]]
+
+    all_errors = _lint_plans(stale)
+
+    if not args.no_cache:
+        failed = {err.path for err in all_errors}
+        # Keep entries for plans outside this run (e.g. not named by --files).
+        linted = set(rel.values())
+        updated = {k: v for k, v in green.items() if k not in linted}
+        updated.update({rel[p]: inputs[p] for p in plans if p not in failed and inputs[p] is not None})
+        _write_green_cache(cache_path, linter_key, updated)
 
     if all_errors:
         print("lint-ci-checkpoint-plans: FAIL")
@@ -6,42 +6,147 @@ import sys
 sys.dont_write_bytecode = True
 
 import argparse
+import functools
+import heapq
 import json
+import os
 import re
+import selectors
+import shutil
+import signal
+import struct
 import subprocess
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
+try:
+    # Optional accelerator. OPT_INDENT_2 output is byte-identical to json.dumps(indent=2,
+    # ensure_ascii=False) for queue payloads, so either path produces the same tasks.json.
+    import orjson
+except ImportError:
+    orjson = None
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+try:
+    # Optional: lets the read-only dry-run stream the queue instead of materializing all of it.
+    import ijson
+except ImportError:
+    ijson = None
 
 
-def _read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(microsecond=0)
 
 
-def _write_json(path: Path, payload: Any) -> None:
-    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+def _iso_z(now: datetime) -> str:
+    return now.isoformat().replace("+00:00", "Z")
+
 
+@functools.lru_cache(maxsize=1)
+def _log_minute(minute: datetime) -> str:
+    return minute.strftime("%Y-%m-%d %H:%M UTC")
 
-def _which(cmd: str) -> bool:
-    from shutil import which
 
-    return which(cmd) is not None
+def _log_ts(now: datetime) -> str:
+    # Session log stamps have minute resolution, so events within a minute share one string.
+    return _log_minute(now.replace(second=0))
+
+
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    # Write-then-rename so a crash mid-write never leaves a truncated queue behind.
+    tmp = path.with_name(path.name + ".tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        tmp.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def _run(cmd: list[str], *, cwd: Path, check: bool = True) -> subprocess.CompletedProcess[str]:
     return subprocess.run(cmd, cwd=str(cwd), text=True, capture_output=True, check=check)
 
 
+def _run_silent(cmd: list[str], *, cwd: Path, check: bool = True) -> subprocess.CompletedProcess[bytes]:
+    # For commands whose output is never read: no pipes to set up, drain, or decode.
+    return subprocess.run(cmd, cwd=str(cwd), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=check)
+
+
 def _git_current_branch(repo_root: Path) -> str:
     return _run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_root).stdout.strip()
 
 
+def _git_common_dir(repo_root: Path) -> Path:
+    out = _run(["git", "rev-parse", "--git-common-dir"], cwd=repo_root).stdout.strip()
+    return (repo_root / out).resolve()
+
+
+_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+
+class _GitCatFile:
+    """
+    A long-lived `git cat-file --batch-check` process for resolving names to object ids, so
+    lookups that can't be answered from the ref files don't each pay for a git fork.
+    """
+
+    cmd = ["git", "cat-file", "--batch-check=%(objectname)"]
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self._proc: subprocess.Popen[str] | None = None
+
+    def resolve(self, name: str) -> str:
+        """Return the object id `name` resolves to, or "" if it doesn't resolve."""
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                self.cmd,
+                cwd=str(self.repo_root),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        self._proc.stdin.write(name + "\n")
+        self._proc.stdin.flush()
+        # Unresolvable names come back as "<name> missing" (or "ambiguous").
+        out = self._proc.stdout.readline().strip()
+        return out if _SHA_RE.fullmatch(out) else ""
+
+
+def _git_branch_sha(cat_file: _GitCatFile, git_dir: Path, branch: str, *, check: bool = False) -> str:
+    """
+    Resolve `refs/heads/<branch>` by reading the ref store directly (loose ref, then packed-refs),
+    which avoids a git fork per lookup. Anything the files don't answer (e.g. reftable repos or a
+    missing branch) goes to the persistent `git cat-file` helper.
+    """
+    ref = f"refs/heads/{branch}"
+    try:
+        sha = (git_dir / ref).read_text(encoding="utf-8").strip()
+        if _SHA_RE.fullmatch(sha):
+            return sha
+    except OSError:
+        try:
+            for line in (git_dir / "packed-refs").read_text(encoding="utf-8").splitlines():
+                sha, _, name = line.partition(" ")
+                if name == ref and _SHA_RE.fullmatch(sha):
+                    return sha
+        except OSError:
+            pass
+    sha = cat_file.resolve(ref)
+    if not sha and check:
+        raise subprocess.CalledProcessError(128, cat_file.cmd + [ref])
+    return sha
+
+
 def _git_has_changes(repo_root: Path) -> bool:
     out = _run(["git", "status", "--porcelain=v1"], cwd=repo_root).stdout
     return bool(out.strip())
@@ -49,17 +154,28 @@ def _git_has_changes(repo_root: Path) -> bool:
 
 def _git_commit_paths(repo_root: Path, paths: list[Path], message: str) -> None:
     rels = [str(p.relative_to(repo_root)) for p in paths]
-    _run(["git", "add", "--"] + rels, cwd=repo_root, check=True)
+    _run_silent(["git", "add", "--"] + rels, cwd=repo_root, check=True)
     if not _git_has_changes(repo_root):
         return
-    _run(["git", "commit", "-m", message], cwd=repo_root, check=True)
+    _run_silent(["git", "commit", "-m", message], cwd=repo_root, check=True)
+
+
+def _docs_commit_message(events: list[str]) -> str:
+    # A single event keeps the historical `docs: start X` / `docs: finish X` subject.
+    return "docs: " + "; ".join(events)
+
+
+# Resolved once: PATH is not expected to change while the orchestrator runs.
+_FSWATCH = shutil.which("fswatch")
 
 
 def _file_watch_once(directory: Path, *, timeout_s: int) -> None:
-    if _which("fswatch"):
+    if _FSWATCH:
         try:
+            # Only `.done` sentinels count: log and message writes under the run root are
+            # filtered out by fswatch rather than waking the loop.
             subprocess.run(
-                ["fswatch", "-1", str(directory)],
+                [_FSWATCH, "-1", "-r", "-e", ".*", "-i", r"\.done$", str(directory)],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 timeout=timeout_s,
@@ -71,9 +187,133 @@ def _file_watch_once(directory: Path, *, timeout_s: int) -> None:
     time.sleep(timeout_s)
 
 
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class _WorkerWatcher:
+    """
+    Wake the main loop as soon as a worker writes its `<task_id>.done` sentinel or exits, instead
+    of sleeping out the full watch timeout. Sentinels are seen via inotify (through libc) on each
+    task's run dir; exits via SIGCHLD delivered to a self-pipe. Both fds share one selector. With
+    neither available, falls back to `_file_watch_once` on the run root.
+    """
+
+    def __init__(self, run_root: Path) -> None:
+        self.run_root = run_root
+        self.selector = selectors.DefaultSelector()
+        self.inotify_fd = -1
+        self.wakeup_fd = -1
+        # Watch descriptor -> the one sentinel name that counts in that run dir.
+        self._sentinels: dict[int, bytes] = {}
+        self._wds: dict[str, int] = {}
+        try:
+            import ctypes
+            import ctypes.util
+
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            fd = -1
+        if fd >= 0:
+            self._libc = libc
+            self.inotify_fd = fd
+            self.selector.register(fd, selectors.EVENT_READ)
+
+        if hasattr(signal, "SIGCHLD"):
+            r, w = os.pipe()
+            os.set_blocking(r, False)
+            os.set_blocking(w, False)
+            try:
+                # A Python-level handler is required for the C handler to write to the wakeup fd.
+                signal.signal(signal.SIGCHLD, lambda *_: None)
+                signal.set_wakeup_fd(w, warn_on_full_buffer=False)
+            except ValueError:  # not the main thread
+                os.close(r)
+                os.close(w)
+            else:
+                self.wakeup_fd = r
+                self.selector.register(r, selectors.EVENT_READ)
+
+    def add(self, task_id: str, run_dir: Path) -> None:
+        # Register before the worker is spawned so a fast worker's sentinel is never missed.
+        if self.inotify_fd >= 0:
+            wd = self._libc.inotify_add_watch(self.inotify_fd, os.fsencode(run_dir), _IN_CLOSE_WRITE | _IN_MOVED_TO)
+            if wd >= 0:
+                self._sentinels[wd] = os.fsencode(f"{task_id}.done")
+                self._wds[task_id] = wd
+
+    def discard(self, task_id: str) -> None:
+        # Stop watching a finished task's run dir so later writes there can't wake the loop.
+        wd = self._wds.pop(task_id, None)
+        if wd is not None:
+            del self._sentinels[wd]
+            self._libc.inotify_rm_watch(self.inotify_fd, wd)
+
+    def _drain_wakeups(self) -> None:
+        try:
+            while os.read(self.wakeup_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _saw_done(self) -> bool:
+        saw = False
+        while True:
+            try:
+                buf = os.read(self.inotify_fd, 65536)
+            except BlockingIOError:
+                return saw
+            off = 0
+            while off < len(buf):
+                wd, _, _, name_len = _INOTIFY_EVENT.unpack_from(buf, off)
+                off += _INOTIFY_EVENT.size
+                if name_len and buf[off : off + name_len].rstrip(b"\0") == self._sentinels.get(wd):
+                    saw = True
+                off += name_len
+
+    def wait(self, procs: Iterable[subprocess.Popen[bytes]], *, timeout_s: int) -> None:
+        if self.inotify_fd < 0 and self.wakeup_fd < 0:
+            _file_watch_once(self.run_root, timeout_s=timeout_s)
+            return
+        # git subprocesses also raise SIGCHLD, so drop stale wakeups first. A worker that exited
+        # before the drain is caught by the poll() below rather than lost.
+        if self.wakeup_fd >= 0:
+            self._drain_wakeups()
+            if any(p.poll() is not None for p in procs):
+                return
+        # Other run-dir writes (prompt.md, last_message.md, ...) also raise inotify events; keep
+        # waiting until a sentinel lands, a child exits, or the timeout expires.
+        deadline = time.monotonic() + timeout_s
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            ready = self.selector.select(remaining)
+            if not ready:
+                return
+            for key, _ in ready:
+                if key.fd == self.wakeup_fd:
+                    return
+                if self._saw_done():
+                    return
+
+
+_TAIL_BYTES = 256 * 1024
+
+
 def _tail_lines(path: Path, n: int) -> str:
+    # Only the last _TAIL_BYTES of the log are read; worker logs can run to many MB.
     try:
-        data = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            start = max(0, size - _TAIL_BYTES)
+            raw = os.pread(f.fileno(), size - start, start)
+        if start:
+            # Drop the (likely partial) first line of the window.
+            raw = raw[raw.find(b"\n") + 1 :]
+        data = raw.decode("utf-8", errors="replace").splitlines()
         return "\n".join(data[-n:]) + ("\n" if data else "")
     except Exception:
         return ""
@@ -111,6 +351,12 @@ def _load_kickoff_text(repo_root: Path, kickoff_ref: str) -> str:
     return ref
 
 
+_COMMANDS_SECTION = "## commands (required)"
+_COMMANDS_HEADERS = {_COMMANDS_SECTION, "commands (required)"}
+_BULLET_RE = re.compile(r"^-\s+(.*)$")
+_BLOCKERS_RE = re.compile(r"(?im)^-\s*\*\*Blocker[s]?\*\*:\s*(.*)$")
+
+
 def _extract_required_commands(kickoff_prompt: str) -> list[str]:
     """
     Best-effort: parse "## Commands (required)" section bullets and return shell commands.
@@ -121,13 +367,13 @@ def _extract_required_commands(kickoff_prompt: str) -> list[str]:
     for raw in lines:
         s = raw.strip()
         if not in_section:
-            if s.lower() == "## commands (required)" or s.lower() == "commands (required)":
+            if s.lower() in _COMMANDS_HEADERS:
                 in_section = True
             continue
         if in_section:
-            if s.startswith("## ") and s.lower() != "## commands (required)":
+            if s.startswith("## ") and s.lower() != _COMMANDS_SECTION:
                 break
-            m = re.match(r"^-\s+(.*)$", s)
+            m = _BULLET_RE.match(s)
             if not m:
                 continue
             item = m.group(1).strip()
@@ -151,6 +397,14 @@ class Task:
     workstream_id: str
 
 
+@dataclass(frozen=True)
+class WorktreeInfo:
+    worktree: str
+    path: Path
+    branch: str
+    base_sha: str
+
+
 def _queue_tasks(payload: Any) -> list[dict[str, Any]]:
     if isinstance(payload, dict):
         tasks = payload.get("tasks", [])
@@ -160,12 +414,45 @@ def _queue_tasks(payload: Any) -> list[dict[str, Any]]:
     raise TypeError("Queue JSON must be an array of tasks or an object with a 'tasks' array.")
 
 
-def _update_task(payload: Any, task_id: str, updates: dict[str, Any]) -> None:
-    for t in _queue_tasks(payload):
-        if str(t.get("id", "")).strip() == task_id:
-            t.update(updates)
-            return
-    raise KeyError(f"Task not found: {task_id}")
+# The only task fields scheduling reads (see `_load_tasks` / `_active_workstreams`).
+_TASK_FIELDS = ("id", "order", "status", "depends_on", "kickoff_prompt", "type", "worktree", "workstream_id")
+
+
+def _stream_task_dicts(queue_path: Path) -> list[dict[str, Any]]:
+    """
+    Read-only counterpart of `_queue_tasks(_read_json(...))` using ijson: tasks are parsed one at
+    a time and trimmed to `_TASK_FIELDS`, so large `blockers`/`unblock_steps` subtrees are not
+    kept. The result must not be written back.
+    """
+    with queue_path.open("rb") as f:
+        head = f.read(64).lstrip()[:1]
+        f.seek(0)
+        if head == b"{":
+            prefix = "tasks.item"
+        elif head == b"[":
+            prefix = "item"
+        else:
+            raise TypeError("Queue JSON must be an array of tasks or an object with a 'tasks' array.")
+        return [
+            {k: t[k] for k in _TASK_FIELDS if k in t}
+            for t in ijson.items(f, prefix, use_float=True)
+            if isinstance(t, dict)
+        ]
+
+
+def _tasks_by_id(tasks_raw: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    # First entry wins for duplicate ids, matching a front-to-back scan.
+    by_id: dict[str, dict[str, Any]] = {}
+    for t in tasks_raw:
+        by_id.setdefault(str(t.get("id", "")).strip(), t)
+    return by_id
+
+
+def _update_task(by_id: dict[str, dict[str, Any]], task_id: str, updates: dict[str, Any]) -> None:
+    t = by_id.get(task_id)
+    if t is None:
+        raise KeyError(f"Task not found: {task_id}")
+    t.update(updates)
 
 
 def _derive_workstream_id(t: dict[str, Any]) -> str:
@@ -182,6 +469,7 @@ def _derive_workstream_id(t: dict[str, Any]) -> str:
     return "WS-DEFAULT"
 
 
+@functools.lru_cache(maxsize=16)
 def _normalize_status(s: str) -> str:
     v = (s or "").strip().lower()
     if v in {"todo", "pending"}:
@@ -197,10 +485,23 @@ def _normalize_status(s: str) -> str:
     return v or "pending"
 
 
-def _load_tasks(payload: Any, repo_root: Path) -> list[Task]:
-    tasks_raw = _queue_tasks(payload)
-    out: list[Task] = []
+def _raw_status(t: dict[str, Any]) -> str:
+    return _normalize_status(str(t.get("status") or "pending"))
+
+
+def _iter_task_dicts(
+    tasks_raw: list[dict[str, Any]], only_ids: set[str], id_re: re.Pattern[str] | None
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield (queue position, raw task) for tasks in scope, before any Task is built."""
     for idx, t in enumerate(tasks_raw):
+        task_id = str(t.get("id", "")).strip()
+        if (not only_ids or task_id in only_ids) and (id_re is None or id_re.search(task_id) is not None):
+            yield idx, t
+
+
+def _load_tasks(indexed: Iterable[tuple[int, dict[str, Any]]]) -> list[Task]:
+    out: list[Task] = []
+    for idx, t in indexed:
         task_id = str(t.get("id", "")).strip()
         if not task_id:
             continue
@@ -219,7 +520,7 @@ def _load_tasks(payload: Any, repo_root: Path) -> list[Task]:
                 id=task_id,
                 index=idx,
                 order=order_int,
-                status=_normalize_status(str(t.get("status") or "pending")),
+                status=_raw_status(t),
                 depends_on=depends_on,
                 kickoff_ref=kickoff_ref,
                 type=typ,
@@ -230,19 +531,55 @@ def _load_tasks(payload: Any, repo_root: Path) -> list[Task]:
     return out
 
 
-def _runnable_tasks(tasks: list[Task], done: set[str]) -> list[Task]:
-    runnable: list[Task] = []
-    for t in tasks:
-        if t.status != "pending":
-            continue
-        if all(dep in done for dep in t.depends_on):
-            runnable.append(t)
-    return sorted(runnable, key=lambda x: x.order)
-
+class _ReadyQueue:
+    """
+    Kahn-style scheduling over pending tasks. Each task waiting on dependencies keeps a count of
+    the ones not yet completed; when the count reaches zero it is pushed onto a heap ordered by
+    (`order`, queue position), so a tick never rescans the whole queue to find runnable work.
+    """
 
-def _active_workstreams(payload: Any) -> set[str]:
+    def __init__(self, tasks: list[Task], done: set[str]) -> None:
+        self._tasks: dict[str, Task] = {}
+        self._waiting: dict[str, int] = {}
+        self._dependents: dict[str, list[str]] = {}
+        self._heap: list[tuple[int, int, str]] = []
+        for t in tasks:
+            if t.status != "pending" or t.id in self._tasks:
+                continue
+            self._tasks[t.id] = t
+            deps = set(t.depends_on) - done
+            if deps:
+                self._waiting[t.id] = len(deps)
+                for dep in deps:
+                    self._dependents.setdefault(dep, []).append(t.id)
+            else:
+                self._heap.append((t.order, t.index, t.id))
+        heapq.heapify(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def ready(self) -> list[Task]:
+        """All runnable tasks in scheduling order, without removing them."""
+        return [self._tasks[task_id] for _, _, task_id in sorted(self._heap)]
+
+    def pop(self) -> Task:
+        return self._tasks[heapq.heappop(self._heap)[2]]
+
+    def push(self, t: Task) -> None:
+        heapq.heappush(self._heap, (t.order, t.index, t.id))
+
+    def complete(self, task_id: str) -> None:
+        for dep_id in self._dependents.pop(task_id, ()):
+            self._waiting[dep_id] -= 1
+            if not self._waiting[dep_id]:
+                del self._waiting[dep_id]
+                self.push(self._tasks[dep_id])
+
+
+def _active_workstreams(tasks_raw: list[dict[str, Any]]) -> set[str]:
     active: set[str] = set()
-    for t in _queue_tasks(payload):
+    for t in tasks_raw:
         if _normalize_status(str(t.get("status") or "")) == "in_progress":
             active.add(_derive_workstream_id(t))
     return active
@@ -261,14 +598,15 @@ def _role_label(task_type: str) -> str:
 
 def _append_session_log(session_log: Path, text: str) -> None:
     session_log.parent.mkdir(parents=True, exist_ok=True)
-    existing = session_log.read_text(encoding="utf-8") if session_log.exists() else ""
-    if existing and not existing.endswith("\n"):
-        existing += "\n"
-    session_log.write_text(existing + text, encoding="utf-8")
+    # Append in place: only the last byte is inspected, to keep entries on their own line.
+    with session_log.open("ab+") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size and os.pread(f.fileno(), 1, size - 1) != b"\n":
+            text = "\n" + text
+        f.write(text.encode("utf-8"))
 
 
-def _session_log_start(*, session_log: Path, task_id: str, role: str, base_branch: str, kickoff_ref: str, worktree: str) -> None:
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+def _session_log_start(*, session_log: Path, ts: str, task_id: str, role: str, base_branch: str, kickoff_ref: str, worktree: str) -> None:
     entry = "\n".join(
         [
             f"## [{ts}] {role} Agent – {task_id} – START",
@@ -286,23 +624,23 @@ def _session_log_start(*, session_log: Path, task_id: str, role: str, base_branc
 def _session_log_end(
     *,
     session_log: Path,
+    ts: str,
     task_id: str,
     role: str,
     worktree: str,
     last_message_path: Path,
     extra: list[str] | None = None,
 ) -> None:
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     snippet = ""
-    if last_message_path.exists():
-        msg = last_message_path.read_text(encoding="utf-8", errors="replace").strip()
-        msg_lines = msg.splitlines()
-        snippet_lines = msg_lines[:40]
-        snippet = "\n".join(snippet_lines).strip()
     blockers_line = "- Blockers: none"
-    if last_message_path.exists():
+    try:
         msg = last_message_path.read_text(encoding="utf-8", errors="replace")
-        m = re.search(r"(?im)^-\\s*\\*\\*Blocker[s]?\\*\\*:\\s*(.*)$", msg)
+    except FileNotFoundError:
+        msg = None
+    if msg is not None:
+        snippet = "\n".join(msg.strip().splitlines()[:40]).strip()
+        # Searched unstripped so `^` anchors see the same line starts as the file.
+        m = _BLOCKERS_RE.search(msg)
         if m:
             tail = m.group(1).strip()
             if tail and tail.lower() not in {"none", "<none>"}:
@@ -333,22 +671,21 @@ def _ensure_worktree(*, repo_root: Path, base_branch: str, worktree: str) -> tup
     # Branch may already exist from prior runs.
     branch_exists = _run(["git", "show-ref", "--verify", "--quiet", f"refs/heads/{branch}"], cwd=repo_root, check=False).returncode == 0
     if branch_exists:
-        _run(["git", "worktree", "add", str(worktree_path), branch], cwd=repo_root, check=True)
+        _run_silent(["git", "worktree", "add", str(worktree_path), branch], cwd=repo_root, check=True)
     else:
-        _run(["git", "worktree", "add", "-b", branch, str(worktree_path), base_branch], cwd=repo_root, check=True)
+        _run_silent(["git", "worktree", "add", "-b", branch, str(worktree_path), base_branch], cwd=repo_root, check=True)
     return worktree_path, branch
 
 
-def _remove_worktree(repo_root: Path, worktree: str) -> None:
-    worktree_path = (repo_root / worktree).resolve()
+def _remove_worktree(repo_root: Path, worktree_path: Path) -> None:
     if not worktree_path.exists():
         return
-    _run(["git", "worktree", "remove", "--force", str(worktree_path)], cwd=repo_root, check=False)
+    _run_silent(["git", "worktree", "remove", "--force", str(worktree_path)], cwd=repo_root, check=False)
 
 
 def _fast_forward_merge(repo_root: Path, *, base_branch: str, integration_branch: str) -> None:
-    _run(["git", "checkout", base_branch], cwd=repo_root, check=True)
-    _run(["git", "merge", "--ff-only", integration_branch], cwd=repo_root, check=True)
+    _run_silent(["git", "checkout", base_branch], cwd=repo_root, check=True)
+    _run_silent(["git", "merge", "--ff-only", integration_branch], cwd=repo_root, check=True)
 
 
 def _make_prompt_text(
@@ -420,6 +757,8 @@ def main(argv: list[str] | None = None) -> int:
             return 2
 
     base_branch = _git_current_branch(repo_root)
+    git_dir = _git_common_dir(repo_root)
+    cat_file = _GitCatFile(repo_root)
 
     only_ids: set[str] = {x.strip() for x in args.only_task_ids.split(",") if x.strip()} if args.only_task_ids else set()
     id_re = re.compile(args.id_regex) if args.id_regex else None
@@ -430,33 +769,95 @@ def main(argv: list[str] | None = None) -> int:
         track_paths.append(session_log)
 
     running: dict[str, subprocess.Popen[bytes]] = {}
-    task_to_worktree: dict[str, str] = {}
-    task_base_sha: dict[str, str] = {}
+    # Resolved once at spawn and reused on the finish path.
+    task_worktrees: dict[str, WorktreeInfo] = {}
+    # Run dirs this process has already created under run_root.
+    made_run_dirs: set[str] = set()
+    # `git worktree add/remove` runs off the main thread; removals are not awaited until the
+    # next tick that creates worktrees (or interpreter exit, which joins the pool).
+    git_pool = ThreadPoolExecutor(max_workers=max(1, int(args.max_workers)))
+    pending_removals: list[Future[None]] = []
+
+    # The in-memory payload is authoritative while the orchestrator runs. Updates mark it dirty,
+    # and it is written back before each docs commit and at the end of every tick. The file is
+    # only re-read (and everything derived from it rebuilt) when its mtime shows an edit from
+    # outside this process. save_queue also checks before writing, since edits can land while the
+    # tick waits on workers.
+    queue_mtime_ns = -1
+    dirty = False
+    # Updates made since the last write, by task id, so they can be replayed onto a fresh read.
+    unsaved: dict[str, dict[str, Any]] = {}
+    watcher = _WorkerWatcher(run_root)
+
+    def update_task(task_id: str, updates: dict[str, Any]) -> None:
+        nonlocal dirty
+        _update_task(by_id, task_id, updates)
+        unsaved.setdefault(task_id, {}).update(updates)
+        dirty = True
+
+    def save_queue() -> None:
+        nonlocal dirty, queue_mtime_ns
+        if not dirty:
+            return
+        if os.stat(queue_path).st_mtime_ns == queue_mtime_ns:
+            _write_json(queue_path, payload)
+            queue_mtime_ns = os.stat(queue_path).st_mtime_ns
+        else:
+            # The file was edited while workers ran (e.g. during the watcher wait). Replay this
+            # process's updates onto the edited file instead of overwriting it, then force the
+            # next tick to reload so the edit is scheduled too.
+            fresh = _read_json(queue_path)
+            fresh_by_id = _tasks_by_id(_queue_tasks(fresh))
+            for task_id, updates in unsaved.items():
+                if task_id in fresh_by_id:
+                    fresh_by_id[task_id].update(updates)
+            _write_json(queue_path, fresh)
+            queue_mtime_ns = -1
+        unsaved.clear()
+        dirty = False
 
     while True:
-        payload = _read_json(queue_path)
-        tasks_all = _load_tasks(payload, repo_root)
-        tasks = [
-            t
-            for t in tasks_all
-            if (not only_ids or t.id in only_ids)
-            and (id_re is None or id_re.search(t.id) is not None)
-        ]
+        mtime_ns = os.stat(queue_path).st_mtime_ns
+        if mtime_ns != queue_mtime_ns:
+            queue_mtime_ns = mtime_ns
+            if args.dry_run and ijson is not None:
+                # Dry-run never writes back, so a trimmed streaming read is enough.
+                tasks_raw = _stream_task_dicts(queue_path)
+            else:
+                payload = _read_json(queue_path)
+                # Task dicts are mutated in place, so the raw list and its id index stay valid
+                # until the next reload.
+                tasks_raw = _queue_tasks(payload)
+            by_id = _tasks_by_id(tasks_raw)
+            # Task fields other than status never change between reloads; status changes are
+            # applied to the scheduler (completions) and `blocked` as they happen. Only in-scope
+            # tasks become Task records; dependencies may point outside the scope, so the
+            # completed set is read from all raw entries.
+            tasks = _load_tasks(_iter_task_dicts(tasks_raw, only_ids, id_re))
+            task_index = {t.id: t for t in reversed(tasks)}
+            done: set[str] = set()
+            blocked: set[str] = set()
+            for raw in tasks_raw:
+                raw_id = str(raw.get("id", "")).strip()
+                if not raw_id:
+                    continue
+                status = _raw_status(raw)
+                if status == "completed":
+                    done.add(raw_id)
+                elif status == "blocked" and (not only_ids or raw_id in only_ids):
+                    blocked.add(raw_id)
+            ready = _ReadyQueue(tasks, done)
 
-        done = {t.id for t in tasks_all if t.status == "completed"}
-        blocked = [t for t in tasks_all if t.status == "blocked" and (not only_ids or t.id in only_ids)]
         if blocked and args.stop_on_blocked:
             print(f"STOP: {len(blocked)} blocked task(s).")
             return 1
 
-        runnable = _runnable_tasks(tasks, done)
-
         # Dry-run is a pure scheduling preview: do not mutate queue state, logs, worktrees, or
         # run-root artifacts.
         if args.dry_run:
-            active_streams = _active_workstreams(payload)
+            active_streams = _active_workstreams(tasks_raw)
             planned: list[Task] = []
-            for t in runnable:
+            for t in ready.ready():
                 if len(planned) >= int(args.max_workers):
                     break
                 if int(args.per_workstream) > 0 and t.workstream_id in active_streams:
@@ -473,62 +874,88 @@ def main(argv: list[str] | None = None) -> int:
                 print(f"DRY RUN: would spawn {t.id} ({t.workstream_id}) in {planned_cwd}")
             return 0
 
-        if not runnable and not running:
+        if not ready and not running:
             print("DONE: no runnable tasks and no running workers (within scope).")
             return 0
 
-        active_streams = _active_workstreams(payload)
-
-        spawned_any = False
-        for t in runnable:
+        active_streams = _active_workstreams(tasks_raw)
+
+        # Docs START for every task picked this tick, recorded in a single commit. All starts are
+        # committed before any worktree is created so task branches include them. This is
+        # required for integration tasks to be fast-forward mergeable back into the base branch.
+        # One timestamp for all START events this tick.
+        now = _utc_now()
+        now_iso, log_ts = _iso_z(now), _log_ts(now)
+        starting: list[Task] = []
+        deferred: list[Task] = []
+        while ready and len(running) + len(starting) < int(args.max_workers):
+            t = ready.pop()
             if t.id in running:
+                # A reload can re-queue a running task whose on-disk status reads pending (e.g. a
+                # stale copy saved over the file). Its worker owns it; drop it, don't defer it.
                 continue
-            if len(running) >= int(args.max_workers):
-                break
             if int(args.per_workstream) > 0 and t.workstream_id in active_streams:
+                deferred.append(t)
                 continue
 
             run_dir = run_root / t.id
-            prompt_path = run_dir / "prompt.md"
             done_path = run_dir / f"{t.id}.done"
-            last_message_path = run_dir / "last_message.md"
-
-            run_dir.mkdir(parents=True, exist_ok=True)
+            # run_root exists already, so one mkdir(2) covers a new run dir; retries skip it.
+            if t.id not in made_run_dirs:
+                run_dir.mkdir(exist_ok=True)
+                made_run_dirs.add(t.id)
             if done_path.exists():
                 done_path.unlink()
+            watcher.add(t.id, run_dir)
 
-            kickoff_text = _load_kickoff_text(repo_root, t.kickoff_ref)
-            worktree_path: Path | None = None
-            worktree_branch: str | None = None
-
-            # Docs START (orchestration branch).
-            _update_task(payload, t.id, {"status": "in_progress", "started_at": _utc_now()})
+            update_task(t.id, {"status": "in_progress", "started_at": now_iso})
             if session_log.exists():
                 _session_log_start(
                     session_log=session_log,
+                    ts=log_ts,
                     task_id=t.id,
                     role=_role_label(t.type),
                     base_branch=base_branch,
                     kickoff_ref=t.kickoff_ref,
                     worktree=t.worktree if t.worktree and t.worktree.strip().upper() != "N/A" else "",
                 )
-            _write_json(queue_path, payload)
-            if not args.dry_run:
-                _git_commit_paths(repo_root, track_paths, f"docs: start {t.id}")
-
-            # Create worktree AFTER the docs start commit so task branches include it. This is
-            # required for integration tasks to be fast-forward mergeable back into the base branch.
-            if t.worktree and t.worktree.strip().upper() != "N/A":
-                worktree_path, worktree_branch = _ensure_worktree(
-                    repo_root=repo_root,
-                    base_branch=base_branch,
-                    worktree=t.worktree,
-                )
-                task_to_worktree[t.id] = t.worktree
+            starting.append(t)
+            active_streams.add(t.workstream_id)
+
+        for t in deferred:
+            ready.push(t)
+
+        if starting:
+            save_queue()
+            _git_commit_paths(repo_root, track_paths, _docs_commit_message([f"start {t.id}" for t in starting]))
+
+        # Settle last tick's removals before creating worktrees (a path may be reused), then
+        # create this tick's worktrees concurrently; each is awaited only when its prompt needs it.
+        for fut in pending_removals:
+            fut.result()
+        pending_removals.clear()
+        worktree_futures = {
+            t.id: git_pool.submit(_ensure_worktree, repo_root=repo_root, base_branch=base_branch, worktree=t.worktree)
+            for t in starting
+            if t.worktree and t.worktree.strip().upper() != "N/A"
+        }
+
+        for t in starting:
+            run_dir = run_root / t.id
+            prompt_path = run_dir / "prompt.md"
+
+            kickoff_text = _load_kickoff_text(repo_root, t.kickoff_ref)
+            worktree_path: Path | None = None
+            worktree_branch: str | None = None
+
+            worktree_future = worktree_futures.get(t.id)
+            if worktree_future is not None:
+                worktree_path, worktree_branch = worktree_future.result()
+                sha = ""
                 if worktree_branch:
-                    sha = _run(["git", "rev-parse", worktree_branch], cwd=repo_root, check=True).stdout.strip()
-                    task_base_sha[t.id] = sha
+                    sha = _git_branch_sha(cat_file, git_dir, worktree_branch, check=True)
                     (run_dir / "base_sha.txt").write_text(sha + "\n", encoding="utf-8")
+                task_worktrees[t.id] = WorktreeInfo(t.worktree, worktree_path, worktree_branch, sha)
 
             prompt_text = _make_prompt_text(
                 repo_root=repo_root,
@@ -540,13 +967,11 @@ def main(argv: list[str] | None = None) -> int:
             )
             prompt_path.write_text(prompt_text, encoding="utf-8")
 
-            if args.dry_run:
-                print(f"DRY RUN: would spawn {t.id} ({t.workstream_id}) in {worktree_path or repo_root}")
-                active_streams.add(t.workstream_id)
-                continue
-
+            # spawn_worker.py is stdlib-only: -I -S skips site.py and user site-packages at startup.
             cmd = [
                 sys.executable,
+                "-I",
+                "-S",
                 str(spawn_script),
                 "--repo-root",
                 str(worktree_path or repo_root),
@@ -559,12 +984,16 @@ def main(argv: list[str] | None = None) -> int:
             ]
             proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             running[t.id] = proc
-            spawned_any = True
-            active_streams.add(t.workstream_id)
 
-        if not spawned_any and running:
-            _file_watch_once(run_root, timeout_s=int(args.watch_timeout_s))
+        # The spawn loop stops only when workers are at capacity or every ready task's workstream
+        # is busy, so nothing else can be scheduled until a worker finishes: always block here.
+        # Sentinel watches are registered before each spawn, so a fast worker can't be missed.
+        if running:
+            watcher.wait(running.values(), timeout_s=int(args.watch_timeout_s))
 
+        # One timestamp for all reap/END events this tick.
+        now = _utc_now()
+        now_iso, log_ts = _iso_z(now), _log_ts(now)
         finished: list[str] = []
         for task_id, proc in list(running.items()):
             run_dir = run_root / task_id
@@ -579,25 +1008,34 @@ def main(argv: list[str] | None = None) -> int:
             if proc.poll() is not None and not done_path.exists():
                 tail = _tail_lines(log_path, 200)
                 failure_path.write_text(
-                    f"# Worker exited without DONE\n\nfinished_at: {_utc_now()}\n\n## Last 200 log lines\n\n```text\n{tail}```\n",
+                    f"# Worker exited without DONE\n\nfinished_at: {now_iso}\n\n## Last 200 log lines\n\n```text\n{tail}```\n",
                     encoding="utf-8",
                 )
-                payload = _read_json(queue_path)
-                _update_task(
-                    payload,
+                update_task(
                     task_id,
                     {
                         "status": "blocked",
-                        "blocked_at": _utc_now(),
+                        "blocked_at": now_iso,
                         "blockers": ["Worker exited without writing DONE sentinel."],
                         "unblock_steps": [f"Inspect {log_path}", f"Inspect {failure_path}", "Re-run task with revised prompt."],
                     },
                 )
-                _write_json(queue_path, payload)
                 finished.append(task_id)
 
+        # Docs END events for this tick are committed together once all finished tasks are
+        # processed; worktrees are removed only after that commit lands.
+        pending_docs: list[str] = []
+        remove_worktrees: list[Path] = []
+
+        def flush_docs() -> None:
+            if pending_docs:
+                save_queue()
+                _git_commit_paths(repo_root, track_paths, _docs_commit_message(pending_docs))
+                pending_docs.clear()
+
         for task_id in finished:
             proc = running.pop(task_id, None)
+            watcher.discard(task_id)
             if proc is not None:
                 proc.poll()
 
@@ -613,51 +1051,47 @@ def main(argv: list[str] | None = None) -> int:
                         k, v = line.split("=", 1)
                         done_info[k.strip()] = v.strip()
 
-            payload = _read_json(queue_path)
-            tasks_all = _load_tasks(payload, repo_root)
-            this = next((t for t in tasks_all if t.id == task_id), None)
+            this = task_index.get(task_id)
             role = _role_label(this.type if this else "")
-            wt = task_to_worktree.get(task_id, this.worktree if this else "")
-            wt = wt if wt and wt.strip().upper() != "N/A" else ""
+            wt_info = task_worktrees.get(task_id)
+            wt = wt_info.worktree if wt_info else ""
 
             status = (done_info.get("status") or "").strip().lower()
             if status != "success":
-                _update_task(
-                    payload,
+                update_task(
                     task_id,
                     {
                         "status": "blocked",
-                        "blocked_at": _utc_now(),
+                        "blocked_at": now_iso,
                         "blockers": [f"Worker status={status or 'unknown'} (see .runs)."],
                         "unblock_steps": [f"Inspect {log_path}", f"Inspect {done_path}", "Adjust prompt and rerun."],
                     },
                 )
-                _write_json(queue_path, payload)
                 if session_log.exists():
                     _session_log_end(
                         session_log=session_log,
+                        ts=log_ts,
                         task_id=task_id,
                         role=role,
                         worktree=wt,
                         last_message_path=last_message_path,
                         extra=[f"- Orchestrator: marked task blocked (worker status={status or 'unknown'})"],
                     )
-                _git_commit_paths(repo_root, track_paths, f"docs: finish {task_id} (blocked)")
+                pending_docs.append(f"finish {task_id} (blocked)")
                 continue
 
             # Require a commit on the task branch when a worktree is involved. This prevents
             # "success" exits that still failed to commit due to sandboxed .git restrictions.
-            if this and wt:
-                branch = Path(wt or this.worktree).name
-                base_sha = task_base_sha.get(task_id) or (run_dir / "base_sha.txt").read_text(encoding="utf-8").strip()
-                branch_sha = _run(["git", "rev-parse", branch], cwd=repo_root, check=False).stdout.strip()
+            if this and wt_info:
+                branch = wt_info.branch
+                base_sha = wt_info.base_sha or (run_dir / "base_sha.txt").read_text(encoding="utf-8").strip()
+                branch_sha = _git_branch_sha(cat_file, git_dir, branch)
                 if not branch_sha or branch_sha == base_sha:
-                    _update_task(
-                        payload,
+                    update_task(
                         task_id,
                         {
                             "status": "blocked",
-                            "blocked_at": _utc_now(),
+                            "blocked_at": now_iso,
                             "blockers": [f"No commit produced on branch '{branch}' (likely commit failed)."],
                             "unblock_steps": [
                                 f"Inspect {run_dir / 'last_message.md'}",
@@ -666,68 +1100,79 @@ def main(argv: list[str] | None = None) -> int:
                             ],
                         },
                     )
-                    _write_json(queue_path, payload)
                     if session_log.exists():
                         _session_log_end(
                             session_log=session_log,
+                            ts=log_ts,
                             task_id=task_id,
                             role=role,
                             worktree=wt,
                             last_message_path=last_message_path,
                             extra=["- Orchestrator: marked task blocked (no commit produced)"],
                         )
-                    _git_commit_paths(repo_root, track_paths, f"docs: finish {task_id} (blocked)")
+                    pending_docs.append(f"finish {task_id} (blocked)")
                     # Keep worktree for inspection.
                     continue
 
             # If this is an integration task, fast-forward merge integration branch to base branch.
             extra: list[str] = []
-            if this and this.type.strip().lower() == "integration" and wt:
-                integration_branch = Path(wt or this.worktree).name
+            if this and this.type.strip().lower() == "integration" and wt_info:
+                integration_branch = wt_info.branch
+                # The merge needs a clean base checkout: land queued docs updates first.
+                flush_docs()
                 try:
                     _fast_forward_merge(repo_root, base_branch=base_branch, integration_branch=integration_branch)
                     extra.append(f"- Orchestrator: fast-forward merged `{integration_branch}` → `{base_branch}`")
                 except subprocess.CalledProcessError as exc:
-                    _update_task(
-                        payload,
+                    update_task(
                         task_id,
                         {
                             "status": "blocked",
-                            "blocked_at": _utc_now(),
+                            "blocked_at": now_iso,
                             "blockers": [f"Failed ff-merge {integration_branch} into {base_branch}: rc={exc.returncode}"],
                             "unblock_steps": ["Inspect git history", "Resolve merge/rebase, then rerun integration task."],
                         },
                     )
-                    _write_json(queue_path, payload)
                     if session_log.exists():
                         _session_log_end(
                             session_log=session_log,
+                            ts=log_ts,
                             task_id=task_id,
                             role=role,
                             worktree=wt,
                             last_message_path=last_message_path,
                             extra=[f"- Orchestrator: marked task blocked (ff-merge failed: `{integration_branch}` → `{base_branch}`)"],
                         )
-                    _git_commit_paths(repo_root, track_paths, f"docs: finish {task_id} (blocked)")
+                    pending_docs.append(f"finish {task_id} (blocked)")
                     continue
 
             # Docs END (orchestration branch).
-            _update_task(payload, task_id, {"status": "completed", "completed_at": _utc_now()})
+            update_task(task_id, {"status": "completed", "completed_at": now_iso})
+            ready.complete(task_id)
             if session_log.exists():
                 _session_log_end(
                     session_log=session_log,
+                    ts=log_ts,
                     task_id=task_id,
                     role=role,
                     worktree=wt,
                     last_message_path=last_message_path,
                     extra=extra,
                 )
-            _write_json(queue_path, payload)
-            _git_commit_paths(repo_root, track_paths, f"docs: finish {task_id}")
+            pending_docs.append(f"finish {task_id}")
 
             # Remove worktree after docs commit (code/test/integration tasks expect cleanup).
-            if wt:
-                _remove_worktree(repo_root, wt)
+            if wt_info:
+                remove_worktrees.append(wt_info.path)
+
+        flush_docs()
+        save_queue()
+        blocked.update(
+            task_id
+            for task_id in finished
+            if by_id[task_id].get("status") == "blocked" and (not only_ids or task_id in only_ids)
+        )
+        pending_removals.extend(git_pool.submit(_remove_worktree, repo_root, p) for p in remove_worktrees)
 
 
 if __name__ == "__main__":
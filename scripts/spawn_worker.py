@@ -7,19 +7,44 @@ sys.dont_write_bytecode = True
 
 import argparse
 import os
-import shlex
-import subprocess
-from datetime import datetime, timezone
-from pathlib import Path
 
 
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    import time
 
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
-def _write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """
+    Write `path` so readers see either no file or the complete contents: write a temp file in the
+    same directory, fsync it, rename it over `path`, then fsync the directory so the new name is
+    durable too.
+    """
+    tmp = f"{path}.tmp.{os.getpid()}"
+    # The name is already unique to this process; O_TRUNC (not O_EXCL) reuses a temp file left by
+    # an earlier crashed worker that had the same PID.
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    os.close(fd)
+    os.replace(tmp, path)
+    if os.name != "nt":
+        dir_fd = os.open(os.path.dirname(path), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 def _which(cmd: str) -> str | None:
@@ -28,14 +53,16 @@ def _which(cmd: str) -> str | None:
     return which(cmd)
 
 
-def _script_supports_command_flag() -> bool:
+def _script_supports_command_flag(script_bin: str) -> bool:
     """
     util-linux `script` expects `-c/--command <cmd>` to run a command.
     BSD/macOS `script` uses `script [options] [file [command ...]]` and has no -c.
     """
+    import subprocess
+
     try:
         help_text = subprocess.run(
-            ["script", "--help"],
+            [script_bin, "--help"],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
@@ -62,85 +89,132 @@ def main(argv: list[str] | None = None) -> int:
         default="codex exec --dangerously-bypass-approvals-and-sandbox",
         help="Codex command prefix (default: 'codex exec --dangerously-bypass-approvals-and-sandbox')",
     )
+    parser.add_argument(
+        "--pty",
+        action="store_true",
+        help="Run codex under `script` (via `bash -lc`) so it gets a PTY (default: exec codex directly)",
+    )
     args = parser.parse_args(argv)
 
-    repo_root = Path(args.repo_root).resolve()
+    # One realpath each, then plain strings: every path below is built with os.path.join and
+    # handed to os-level calls as is.
+    repo_root = os.path.realpath(args.repo_root)
     task_id = str(args.task_id).strip()
-    run_dir = Path(args.run_dir).resolve()
+    run_dir = os.path.realpath(args.run_dir)
 
-    prompt_path = run_dir / args.prompt_file
-    log_path = run_dir / args.log_file
-    pid_path = run_dir / args.pid_file
-    last_message_path = run_dir / args.last_message_file
+    prompt_path = os.path.join(run_dir, args.prompt_file)
+    log_path = os.path.join(run_dir, args.log_file)
+    pid_path = os.path.join(run_dir, args.pid_file)
+    last_message_path = os.path.join(run_dir, args.last_message_file)
     done_name = args.done_file.strip() or f"{task_id}.done"
-    done_path = run_dir / done_name
+    done_path = os.path.join(run_dir, done_name)
 
-    run_dir.mkdir(parents=True, exist_ok=True)
-    if done_path.exists():
-        done_path.unlink()
+    os.makedirs(run_dir, exist_ok=True)
+    # One unlink(2) instead of a stat + unlink pair for a stale sentinel.
+    try:
+        os.unlink(done_path)
+    except FileNotFoundError:
+        pass
 
-    _write_text(pid_path, f"{os.getpid()}\n")
+    # run_dir was created above. The PID is a few bytes, so one raw write is enough.
+    pid_fd = os.open(pid_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(pid_fd, b"%d\n" % os.getpid())
+    finally:
+        os.close(pid_fd)
 
-    if not prompt_path.exists():
-        _write_text(done_path, f"status=failed\ntask_id={task_id}\nfinished_at={_utc_now()}\nerror=missing_prompt\n")
+    if not os.path.exists(prompt_path):
+        _atomic_write(done_path, f"status=failed\ntask_id={task_id}\nfinished_at={_utc_now()}\nerror=missing_prompt\n".encode("utf-8"))
         return 2
 
-    if not repo_root.exists():
-        _write_text(done_path, f"status=failed\ntask_id={task_id}\nfinished_at={_utc_now()}\nerror=missing_repo\n")
+    if not os.path.exists(repo_root):
+        _atomic_write(done_path, f"status=failed\ntask_id={task_id}\nfinished_at={_utc_now()}\nerror=missing_repo\n".encode("utf-8"))
         return 2
 
-    script_path = _which("script")
-    use_script = script_path is not None
-    codex_prefix = args.codex_cmd.strip()
+    # Only needed once we know a worker will actually be spawned.
+    import shlex
+    import signal
 
-    inner = f'{codex_prefix} -o {shlex.quote(str(last_message_path))} - < {shlex.quote(str(prompt_path))}'
+    codex_prefix = args.codex_cmd.strip()
+    prompt_fd: int | None = None
 
-    if use_script:
+    # Resolved once; the --help probe takes the path instead of walking PATH again.
+    script_bin = _which("script") if args.pty else None
+    if script_bin is not None:
+        inner = f'{codex_prefix} -o {shlex.quote(last_message_path)} - < {shlex.quote(prompt_path)}'
         # `script` provides a PTY; we run bash -lc so redirection works.
         #
         # IMPORTANT: util-linux `script` requires `-c/--command` to run a command.
         # BSD/macOS `script` takes `[file [command...]]` and does not support `-c`.
-        if _script_supports_command_flag():
+        if _script_supports_command_flag(script_bin):
             bash_cmd = f"bash -lc {shlex.quote(inner)}"
-            cmd = ["script", "-q", "-e", "-c", bash_cmd, "/dev/null"]
+            cmd = [script_bin, "-q", "-e", "-c", bash_cmd, "/dev/null"]
         else:
-            cmd = ["script", "-e", "-q", "/dev/null", "bash", "-lc", inner]
+            cmd = [script_bin, "-e", "-q", "/dev/null", "bash", "-lc", inner]
     else:
-        cmd = ["bash", "-lc", inner]
+        # Exec codex directly with the prompt on stdin: no login shell (or `script`) in between.
+        # Without `script` there is no PTY to give, so --pty falls back to this too rather than
+        # quoting everything into a `bash -lc` string just for the redirect.
+        cmd = shlex.split(codex_prefix) + ["-o", last_message_path, "-"]
 
     exit_code: int = 0
     status = "success"
     error: str | None = None
     try:
-        with log_path.open("wb") as log_handle:
-            completed = subprocess.run(
-                cmd,
-                cwd=str(repo_root),
-                stdout=log_handle,
-                stderr=subprocess.STDOUT,
-                check=False,
-            )
-            exit_code = int(completed.returncode)
+        # A raw fd: the parent never writes the log, so no BufferedWriter is needed. O_APPEND keeps
+        # the shared stdout/stderr writes at the end.
+        log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND | os.O_CLOEXEC, 0o644)
+        try:
+            file_actions = [(os.POSIX_SPAWN_DUP2, log_fd, 1), (os.POSIX_SPAWN_DUP2, log_fd, 2)]
+            if script_bin is None:
+                prompt_fd = os.open(prompt_path, os.O_RDONLY)
+                file_actions.append((os.POSIX_SPAWN_DUP2, prompt_fd, 0))
+            # posix_spawn has no cwd argument. This process exists only to run the worker and every
+            # path above is absolute, so changing its own cwd is safe.
+            os.chdir(repo_root)
+            try:
+                # posix_spawn lets libc use vfork/clone(CLONE_VM) instead of copying page tables.
+                # Both fds are O_CLOEXEC, so only the dup2'd copies reach the child. Python ignores
+                # SIGPIPE and SIGXFSZ; reset them to default as subprocess does, or every pipeline
+                # codex runs (`git log | head`) would see EPIPE instead of exiting quietly.
+                pid = os.posix_spawnp(
+                    cmd[0],
+                    cmd,
+                    os.environ,
+                    file_actions=file_actions,
+                    setsigdef=(signal.SIGPIPE, signal.SIGXFSZ),
+                )
+            finally:
+                if prompt_fd is not None:
+                    os.close(prompt_fd)
+            exit_code = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+            # Make the log durable before the DONE sentinel (written and fsynced below) exists, so a
+            # crash can never leave a sentinel on disk pointing at a log that lost its tail.
+            os.fsync(log_fd)
+            if hasattr(os, "posix_fadvise"):
+                # The pages are clean after the fsync; drop them rather than let many workers' logs
+                # crowd the page cache.
+                os.posix_fadvise(log_fd, 0, 0, os.POSIX_FADV_DONTNEED)
             if exit_code != 0:
                 status = "failed"
                 error = "nonzero_exit"
+        finally:
+            os.close(log_fd)
     except Exception as exc:
         status = "failed"
         error = f"exception:{type(exc).__name__}"
         exit_code = 1
 
-    lines = [
-        f"status={status}",
-        f"task_id={task_id}",
-        f"finished_at={_utc_now()}",
-        f"log_path={log_path}",
-        f"last_message_path={last_message_path}",
-        f"exit_code={exit_code}",
-    ]
-    if error:
-        lines.append(f"error={error}")
-
-    _write_text(done_path, "\n".join(lines) + "\n")
+    payload = (
+        f"status={status}\n"
+        f"task_id={task_id}\n"
+        f"finished_at={_utc_now()}\n"
+        f"log_path={log_path}\n"
+        f"last_message_path={last_message_path}\n"
+        f"exit_code={exit_code}\n"
+        + (f"error={error}\n" if error else "")
+    )
+    _atomic_write(done_path, payload.encode("utf-8"))
     return 0 if status == "success" else 1
 
 